@@ -1,9 +1,17 @@
+import collections
+import logging
+import os
+import sys
+
 from argh import arg
 
 import pnc_cli.common as common
 import pnc_cli.cli_types as types
 import pnc_cli.utils as utils
 from pnc_cli.pnc_api import pnc_api
+from pnc_cli.swagger_client.rest import ApiException
+
+LOG_CHUNK_SIZE = 64 * 1024
 
 
 @arg("-p", "--page-size", help="Limit the amount of BuildRecords returned", type=int)
@@ -139,13 +147,14 @@ def get_audited_configuration_for_record_raw(id):
 
 
 @arg("id", help="BuildRecord ID to retrieve the log from.", type=types.existing_build_record)
-def get_log_for_record(id):
+@arg("-o", "--output", help="File to write the log to instead of the standard output.")
+@arg("-t", "--tail", help="Only print the last N lines of the log.", type=int)
+@arg("-r", "--resume", help="Only download the part of the log missing from the --output file.")
+def get_log_for_record(id, output=None, tail=None, resume=False):
     """
     Get the log for a given BuildRecord
     """
-    data = get_log_for_record_raw(id)
-    if data:
-        return utils.format_json(data)
+    stream_log('/build-records/{id}/log', id, output, tail, resume)
 
 def get_log_for_record_raw(id):
     response = utils.checked_api_call(pnc_api.builds, 'get_logs', id=id)
@@ -153,6 +162,77 @@ def get_log_for_record_raw(id):
         return response
 
 
+@arg("id", help="BuildRecord ID to retrieve the repour log from.", type=types.existing_build_record)
+@arg("-o", "--output", help="File to write the log to instead of the standard output.")
+@arg("-t", "--tail", help="Only print the last N lines of the log.", type=int)
+@arg("-r", "--resume", help="Only download the part of the log missing from the --output file.")
+def get_repour_log_for_record(id, output=None, tail=None, resume=False):
+    """
+    Get the repour log for a given BuildRecord
+    """
+    stream_log('/build-records/{id}/repour-log', id, output, tail, resume)
+
+def get_repour_log_for_record_raw(id):
+    response = utils.checked_api_call(pnc_api.builds, 'get_repour_logs', id=id)
+    if response:
+        return response
+
+
+def stream_log(resource_path, id, output=None, tail=None, resume=False):
+    """
+    Writes a BuildRecord log to output, or to the standard output, as it is downloaded
+    :param resource_path: REST path of the log, with an {id} placeholder
+    :param id: BuildRecord ID
+    :param output: file to write the log to
+    :param tail: only write the last tail lines
+    :param resume: request only the bytes missing from output
+    """
+    header_params = {'Accept': 'text/plain'}
+    mode = 'wb'
+    if output and resume and not tail and os.path.exists(output):
+        header_params['Range'] = 'bytes={}-'.format(os.path.getsize(output))
+        mode = 'ab'
+
+    try:
+        response = pnc_api.builds.api_client.call_api(resource_path, 'GET', path_params={'id': id},
+                                                      header_params=header_params, _preload_content=False)
+    except ApiException as e:
+        if e.status == 416:
+            logging.info("Log of BuildRecord {} is already fully downloaded.".format(id))
+        else:
+            print(e)
+        return
+
+    if 'Range' in header_params and response.status != 206:
+        # the server sent the whole log
+        mode = 'wb'
+    out = open(output, mode) if output else getattr(sys.stdout, 'buffer', sys.stdout)
+    try:
+        if tail:
+            write_tail(response.stream(LOG_CHUNK_SIZE), out, tail)
+        else:
+            for chunk in response.stream(LOG_CHUNK_SIZE):
+                out.write(chunk)
+                out.flush()
+    finally:
+        response.release_conn()
+        if output:
+            out.close()
+
+
+def write_tail(chunks, out, lines_count):
+    lines = collections.deque(maxlen=lines_count)
+    partial = b''
+    for chunk in chunks:
+        chunk_lines = (partial + chunk).split(b'\n')
+        partial = chunk_lines.pop()
+        lines.extend(chunk_lines)
+    if partial:
+        lines.append(partial)
+    for line in lines:
+        out.write(line + b'\n')
+
+
 @arg("id", help="BuildRecord ID to add an Attribute to.", type=types.existing_build_record)
 @arg("key", help="Key for the Attribute.")
 @arg("value", help="Value for the Attribute.")
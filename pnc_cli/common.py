@@ -1,5 +1,6 @@
 import argh.exceptions
 
+import pnc_cli.entity_cache as entity_cache
 import pnc_cli.utils as utils
 
 """
@@ -14,7 +15,7 @@ def id_exists(api, search_id):
     :param search_id: id to test for
     :return: True if an entity with ID search_id exists, false otherwise
     """
-    response = utils.checked_api_call(api, 'get_specific', id=search_id)
+    response = entity_cache.get_specific(api, search_id)
     return response is not None
 
 
@@ -47,7 +48,7 @@ def get_entity(api, entity_id):
     :param id: id of the entity to retrieve
     :return: REST entity
     """
-    response = utils.checked_api_call(api, 'get_specific', id=entity_id)
+    response = entity_cache.get_specific(api, entity_id)
     if response:
         return response.content
     return
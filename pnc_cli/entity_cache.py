@@ -0,0 +1,116 @@
+import atexit
+import json
+import logging
+import os
+import tempfile
+
+import pnc_cli.utils as utils
+
+"""
+Persistent cache of slowly changing REST entities, such as Environments and Licenses.
+Entities are keyed by API class and ID and kept between invocations for a per-API time to live.
+"""
+
+ENTITY_CACHE_FILENAME = "entity-cache.json"
+ENTITY_CACHE = utils.CONFIG_LOCATION + ENTITY_CACHE_FILENAME
+
+# seconds an entity retrieved through each API stays valid
+TTLS = {
+    'EnvironmentsApi': 24 * 60 * 60,
+    'LicensesApi': 24 * 60 * 60,
+    'ProductsApi': 60 * 60,
+    'RepositoryconfigurationsApi': 60 * 60,
+}
+
+enabled = True
+entries = None
+dirty = False
+
+
+class CachedResponse():
+    def __init__(self, data):
+        self.data = data
+
+
+def get_specific(api, entity_id):
+    """
+    Calls 'get_specific' on the given API, unless a still valid response for entity_id is cached
+    :param api: api to call get_specific on
+    :param entity_id: id of the entity to retrieve
+    :return: the get_specific response, None if the call failed
+    """
+    global dirty
+    ttl = TTLS.get(type(api).__name__)
+    if not enabled or ttl is None:
+        return utils.checked_api_call(api, 'get_specific', id=entity_id)
+
+    key = cache_key(api, entity_id)
+    entry = load().get(key)
+    if entry and utils.current_time_millis() - entry['time'] < ttl * 1000:
+        logging.debug("Using cached {}".format(key))
+        return api.api_client.deserialize(CachedResponse(entry['data']), entry['type'])
+
+    response = utils.checked_api_call(api, 'get_specific', id=entity_id)
+    if response is not None:
+        load()[key] = {'time': utils.current_time_millis(),
+                       'type': type(response).__name__,
+                       'data': json.dumps(api.api_client.sanitize_for_serialization(response))}
+        dirty = True
+    return response
+
+
+def invalidate(api, entity_id):
+    """
+    Drops the cached entity, to be called whenever it is updated or deleted
+    """
+    global dirty
+    if load().pop(cache_key(api, entity_id), None) is not None:
+        dirty = True
+
+
+def cache_key(api, entity_id):
+    return "{}:{}".format(type(api).__name__, entity_id)
+
+
+def load():
+    global entries
+    if entries is None:
+        entries = {}
+        if os.path.exists(ENTITY_CACHE):
+            try:
+                with open(ENTITY_CACHE) as f:
+                    entries = json.load(f)
+            except (IOError, ValueError) as e:
+                logging.debug("Ignoring unreadable entity cache: {}".format(e))
+    return entries
+
+
+def save():
+    if not dirty:
+        return
+    now = utils.current_time_millis()
+    valid = {}
+    for key, entry in entries.items():
+        ttl = TTLS.get(key.split(':')[0])
+        if ttl is not None and now - entry['time'] < ttl * 1000:
+            valid[key] = entry
+    # write-rename, so that concurrent invocations never read a partial file
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(ENTITY_CACHE), prefix='.' + ENTITY_CACHE_FILENAME)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(valid, f)
+        os.rename(temp_path, ENTITY_CACHE)
+    except (IOError, OSError) as e:
+        logging.debug("Could not save the entity cache: {}".format(e))
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+atexit.register(save)
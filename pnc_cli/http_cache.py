@@ -0,0 +1,90 @@
+import errno
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+"""
+Disk store of REST responses revalidated with conditional GET requests.
+"""
+
+
+class HttpCache(object):
+    """
+    Keeps response headers and bodies in one file per request under `directory`.
+    Once the files exceed `max_size` bytes, the least recently used are removed.
+    """
+
+    def __init__(self, directory, max_size):
+        self.directory = directory
+        self.max_size = max_size
+        try:
+            os.makedirs(directory)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+
+    def get(self, key):
+        """
+        Returns the (headers, body) cached for key, None if there are none
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                meta = json.loads(f.readline().decode('utf-8'))
+                body = f.read()
+        except (IOError, ValueError):
+            return None
+        if meta.get('key') != key:
+            return None
+        try:
+            # the modification time orders entries for eviction
+            os.utime(path, None)
+        except OSError:
+            pass
+        return meta['headers'], body
+
+    def put(self, key, headers, body):
+        """
+        Stores the response for key, then evicts entries over the size limit
+        """
+        meta = json.dumps({'key': key, 'headers': headers}).encode('utf-8')
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(meta + b'\n')
+                f.write(body if isinstance(body, bytes) else body.encode('utf-8'))
+            os.rename(temp_path, self._path(key))
+        except (IOError, OSError) as e:
+            logging.debug("Could not cache response for {}: {}".format(key, e))
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def _path(self, key):
+        if not isinstance(key, bytes):
+            key = key.encode('utf-8')
+        return os.path.join(self.directory, hashlib.sha1(key).hexdigest())
@@ -2,6 +2,8 @@ from argh import arg
 from six import iteritems
 
 import pnc_cli.cli_types as types
+import pnc_cli.common as common
+import pnc_cli.entity_cache as entity_cache
 import pnc_cli.utils as utils
 
 from pnc_cli.swagger_client import LicenseRest
@@ -34,10 +36,9 @@ def get_license(id):
     """
     Get a specific License by either ID or fullname
     """
-    response = utils.checked_api_call(
-        pnc_api.licenses, 'get_specific', id= id)
-    if response:
-        return utils.format_json(response.content)
+    content = common.get_entity(pnc_api.licenses, id)
+    if content:
+        return utils.format_json(content)
 
 
 @arg("license_id", help="ID of the License to delete", type=types.existing_license)
@@ -48,6 +49,7 @@ def delete_license(license_id):
     """
 
     response = utils.checked_api_call(pnc_api.licenses, 'delete', id=license_id)
+    entity_cache.invalidate(pnc_api.licenses, license_id)
     if response:
         return utils.format_json(response.content)
 
@@ -72,6 +74,7 @@ def update_license(license_id, **kwargs):
         'update',
         id=int(license_id),
         body=updated_license)
+    entity_cache.invalidate(pnc_api.licenses, license_id)
     if response:
         return utils.format_json(response.content)
 
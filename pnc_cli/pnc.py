@@ -20,6 +20,7 @@ from pnc_cli import runningbuilds
 from pnc_cli import users
 from pnc_cli import archives
 import pnc_cli.user_config as uc
+import pnc_cli.entity_cache as entity_cache
 from pnc_cli import makemead
 from pnc_cli import generate_repo
 import argparse
@@ -39,10 +40,20 @@ class LoggerAction(argparse.Action):
             logging.getLogger().setLevel(logging.ERROR)
 
 
+class NoCacheAction(argparse.Action):
+    def __init__(self, option_strings, dest, nargs=0, **kwargs):
+        super(NoCacheAction, self).__init__(option_strings, dest, nargs=nargs, **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string):
+        entity_cache.disable()
+
+
 parser = argh.ArghParser()
 parser.add_argument("--debug", action=LoggerAction, help="Print debug messages.")
 parser.add_argument("-v","--verbose", action=LoggerAction, help="Print info messages.")
 parser.add_argument("-q","--quiet", action=LoggerAction, help="Print only error messages.")
+parser.add_argument("--no-cache", action=NoCacheAction, help="Retrieve Environments, Licenses, Products and "
+                                                            "RepositoryConfigurations from PNC instead of the local cache.")
 parser.add_commands([uc.login,
                      products.create_product,
                      products.get_product,
@@ -90,6 +101,7 @@ parser.add_commands([uc.login,
                      buildrecords.get_audited_configuration_for_record,
                      buildrecords.get_build_record,
                      buildrecords.get_log_for_record,
+                     buildrecords.get_repour_log_for_record,
                      buildrecords.list_attributes,
                      buildrecords.list_build_records,
                      buildrecords.list_built_artifacts,
@@ -134,7 +146,11 @@ parser.autocomplete()
 
 
 def main():
-    parser.dispatch()
+    try:
+        parser.dispatch()
+    finally:
+        if uc.rest_client is not None:
+            logging.debug("HTTP connection pool: {}".format(uc.rest_client.pool_stats))
 
 
 if __name__ == "__main__":
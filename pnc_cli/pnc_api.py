@@ -48,6 +48,13 @@ class PncApi:
             self._user = uc.get_user()
         return self._user
 
+    def submit(self, fn, *args, **kwargs):
+        """
+        Runs fn(*args, **kwargs) on the API client's bounded executor, blocking while its queue is full
+        :return: Future of the call's result
+        """
+        return self.user.get_api_client().executor.submit(fn, *args, **kwargs)
+
     @property
     def bpm(self):
         if not self._bpm:
@@ -69,7 +76,7 @@ class PncApi:
     @property
     def builds_running(self):
         if not self._builds_running:
-            self._builds_running = BuildsApi()
+            self._builds_running = BuildsApi(self.user.get_api_client())
         return self._builds_running
 
     @property
@@ -147,7 +154,7 @@ class PncApi:
     @property
     def users(self):
         if not self._users:
-            self._users = UsersApi
+            self._users = UsersApi(self.user.get_api_client())
         return self._users
 
 pnc_api = PncApi()
@@ -1,5 +1,38 @@
+import logging
+
+try:
+    import configparser
+except ImportError:
+    import ConfigParser as configparser
+
+
 class PncServerConfig():
     PNC_REST_LOCATION = '/pnc-rest/rest'
 
     def __init__(self, config):
         self.url = config.get('PNC', 'pncUrl').rstrip('/') + self.PNC_REST_LOCATION
+        self.pool_maxsize = self.parse_int(config, 'connectionPoolSize')
+        self.pool_block = self.parse_bool(config, 'connectionPoolBlock')
+        self.pool_idle_timeout = self.parse_int(config, 'connectionIdleTimeout')
+        self.async_workers = self.parse_int(config, 'asyncWorkers')
+        self.async_queue_size = self.parse_int(config, 'asyncQueueSize')
+        self.memoize_requests = self.parse_bool(config, 'memoizeRequests')
+        self.http_cache_size = self.parse_int(config, 'httpCacheSize')
+
+    def parse_int(self, config, option):
+        try:
+            return config.getint('PNC', option)
+        except configparser.NoOptionError:
+            return None
+        except ValueError:
+            logging.error('"{}" in pnc-cli.conf must be a number.'.format(option))
+            return None
+
+    def parse_bool(self, config, option):
+        try:
+            return config.getboolean('PNC', option)
+        except configparser.NoOptionError:
+            return None
+        except ValueError:
+            logging.error('"{}" in pnc-cli.conf must be true or false.'.format(option))
+            return None
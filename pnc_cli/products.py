@@ -2,6 +2,7 @@ from argh import arg
 from six import iteritems
 
 import pnc_cli.common as common
+import pnc_cli.entity_cache as entity_cache
 import pnc_cli.cli_types as types
 import pnc_cli.utils as utils
 from pnc_cli.swagger_client import ProductRest
@@ -65,6 +66,7 @@ def update_product_raw(product_id, **kwargs):
 
     response = utils.checked_api_call(
         pnc_api.products, 'update', id=product_id, body=to_update)
+    entity_cache.invalidate(pnc_api.products, product_id)
     if response:
         return response.content
 
@@ -83,9 +85,7 @@ def get_product_raw(id=None, name=None):
     prod_id = common.set_id(pnc_api.products, id, name)
     if prod_id is None:
         return None
-    response = utils.checked_api_call(pnc_api.products, 'get_specific', id=prod_id)
-    if response:
-        return response.content
+    return common.get_entity(pnc_api.products, prod_id)
 
 
 @arg("-i", "--id", help="ID of the Product to retrieve versions from", type=types.existing_product_id)
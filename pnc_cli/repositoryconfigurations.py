@@ -3,6 +3,7 @@ from argh.exceptions import CommandError
 
 import logging
 import pnc_cli.common as common
+import pnc_cli.entity_cache as entity_cache
 import pnc_cli.cli_types as types
 from pnc_cli import swagger_client
 from pnc_cli import utils
@@ -15,9 +16,7 @@ def get_repository_configuration(id):
     Retrieve a specific RepositoryConfiguration
     """
 
-    response = utils.checked_api_call(pnc_api.repositories, 'get_specific', id=id)
-    if response:
-        return response.content
+    return common.get_entity(pnc_api.repositories, id)
 
 
 @arg("id", help="ID of the RepositoryConfiguration to update.", type=types.existing_rc_id)
@@ -43,6 +42,7 @@ def update_repository_configuration(id, external_repository=None, prebuild_sync=
         return
 
     response = utils.checked_api_call(pnc_api.repositories, 'update', id=to_update_id, body=bc_to_update)
+    entity_cache.invalidate(pnc_api.repositories, to_update_id)
     if response:
         return response.content
 
@@ -22,9 +22,12 @@ from __future__ import absolute_import
 from . import models
 from .rest import RESTClientObject
 from .rest import ApiException
+from .rest import UploadFile
 
 import os
 import re
+import hashlib
+import logging
 import urllib
 import json
 import sys
@@ -33,6 +36,8 @@ import random
 import tempfile
 import threading
 
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from datetime import date
 
@@ -49,6 +54,111 @@ except ImportError:
 from .configuration import Configuration
 
 
+logger = logging.getLogger(__name__)
+
+# bytes read at once when streaming a downloaded file to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class BoundedExecutor(object):
+    """
+    Thread pool running asynchronous API calls.
+
+    At most `max_workers` calls run at once and up to `queue_size` more
+    wait for a free worker. `submit` blocks the caller while the queue
+    is full, so producers cannot outrun the workers.
+
+    :param max_workers: number of worker threads.
+    :param queue_size: number of calls allowed to wait for a worker.
+    """
+    def __init__(self, max_workers, queue_size):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._slots = threading.BoundedSemaphore(max_workers + queue_size)
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Schedules `fn(*args, **kwargs)`, waiting for a free queue slot.
+
+        :return: concurrent.futures.Future of the call.
+        """
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda f: self._slots.release())
+        return future
+
+    def shutdown(self, wait=True):
+        """
+        Stops accepting calls, optionally waiting for the pending ones.
+        """
+        self._executor.shutdown(wait=wait)
+
+
+class RequestCoalescer(object):
+    """
+    Shares one server round trip between identical GET requests in flight
+    at the same time.
+
+    With `memoize` enabled, responses are also kept and served again until
+    the next modifying request, for the lifetime of the coalescer.
+    """
+    def __init__(self, memoize=False):
+        self.memoize = memoize
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self._memo = {}
+        self._generation = 0
+
+    def request(self, key, fetch):
+        """
+        Returns the response for `key`, calling `fetch` only if no identical
+        request is already in flight (or memoized).
+
+        :param key: hashable identity of the request.
+        :param fetch: callable performing the request.
+        """
+        with self._lock:
+            if key in self._memo:
+                return self._memo[key]
+            future = self._in_flight.get(key)
+            if future is not None:
+                leader = False
+            else:
+                leader = True
+                future = self._in_flight[key] = Future()
+                generation = self._generation
+
+        if not leader:
+            return future.result()
+
+        try:
+            response = fetch()
+        except Exception as e:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._in_flight[key]
+            # a modifying request completed meanwhile, the response may be stale
+            if self.memoize and generation == self._generation:
+                self._memo[key] = response
+        future.set_result(response)
+        return response
+
+    def invalidate(self):
+        """
+        Forgets memoized responses, called after every modifying request.
+        """
+        with self._lock:
+            self._generation += 1
+            self._memo.clear()
+
+
 class ApiClient(object):
     """
     Generic API client for Swagger client library builds.
@@ -65,14 +175,17 @@ class ApiClient(object):
     :param host: The base path for the server to call.
     :param header_name: a header to pass when making calls to the API.
     :param header_value: a header value to pass when making calls to the API.
+    :param rest_client: RESTClientObject to share its connection pool,
+                        a new one is created when not provided.
     """
     def __init__(self, host=Configuration().host,
-                 header_name=None, header_value=None, cookie=None):
+                 header_name=None, header_value=None, cookie=None,
+                 rest_client=None):
 
         """
         Constructor of the class.
         """
-        self.rest_client = RESTClientObject()
+        self.rest_client = rest_client or RESTClientObject()
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -80,6 +193,10 @@ class ApiClient(object):
         self.cookie = cookie
         # Set default User-Agent.
         self.user_agent = 'Python-Swagger/1.0.0'
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self.coalescer = RequestCoalescer(Configuration().memoize_get_requests)
+        self.last_download_checksum = None
 
     @property
     def user_agent(self):
@@ -95,13 +212,27 @@ class ApiClient(object):
         """
         self.default_headers['User-Agent'] = value
 
+    @property
+    def executor(self):
+        """
+        Gets the executor running asynchronous requests,
+        sized by `Configuration().async_workers` and `async_queue_size`.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                config = Configuration()
+                self._executor = BoundedExecutor(config.async_workers,
+                                                 config.async_queue_size)
+            return self._executor
+
     def set_default_header(self, header_name, header_value):
         self.default_headers[header_name] = header_value
 
     def __call_api(self, resource_path, method,
                    path_params=None, query_params=None, header_params=None,
                    body=None, post_params=None, files=None,
-                   response_type=None, auth_settings=None, callback=None):
+                   response_type=None, auth_settings=None, callback=None,
+                   _preload_content=True):
 
         # headers parameters
         header_params = header_params or {}
@@ -141,23 +272,46 @@ class ApiClient(object):
         url = self.host + resource_path
 
         # perform request and return response
-        response_data = self.request(method, url,
-                                     query_params=query_params,
-                                     headers=header_params,
-                                     post_params=post_params, body=body)
+        if not _preload_content or response_type == "file":
+            # streamed responses are neither shared nor buffered in memory
+            response_data = self.request(method, url,
+                                         query_params=query_params,
+                                         headers=header_params,
+                                         post_params=post_params, body=body,
+                                         _preload_content=False)
+            if method not in ('GET', 'HEAD'):
+                self.coalescer.invalidate()
+        elif method == 'GET':
+            # identical GETs in flight share a single round trip
+            key = (method, url,
+                   tuple(sorted(iteritems(query_params or {}))),
+                   header_params.get('Accept'),
+                   header_params.get('Authorization'))
+            response_data = self.coalescer.request(
+                key, lambda: self.request(method, url,
+                                          query_params=query_params,
+                                          headers=header_params))
+        else:
+            response_data = self.request(method, url,
+                                         query_params=query_params,
+                                         headers=header_params,
+                                         post_params=post_params, body=body)
+            if method != 'HEAD':
+                self.coalescer.invalidate()
 
         self.last_response = response_data
 
         # deserialize response data
-        if response_type:
+        if not _preload_content:
+            deserialized_data = response_data
+        elif response_type:
             deserialized_data = self.deserialize(response_data, response_type)
         else:
             deserialized_data = None
 
         if callback:
             callback(deserialized_data)
-        else:
-            return deserialized_data
+        return deserialized_data
 
     def to_path_value(self, obj):
         """
@@ -285,7 +439,8 @@ class ApiClient(object):
     def call_api(self, resource_path, method,
                  path_params=None, query_params=None, header_params=None,
                  body=None, post_params=None, files=None,
-                 response_type=None, auth_settings=None, callback=None):
+                 response_type=None, auth_settings=None, callback=None,
+                 _preload_content=True):
         """
         Makes the HTTP request (synchronous) and return the deserialized data.
         To make an async request, define a function for callback.
@@ -306,10 +461,14 @@ class ApiClient(object):
         :param callback function: Callback function for asynchronous request.
             If provide this parameter,
             the request will be called asynchronously.
+        :param _preload_content: if False, the urllib3.HTTPResponse is
+            returned without reading or deserializing its body, to be read
+            in chunks with `stream()` and released with `release_conn()`.
         :return:
             If provide parameter callback,
             the request will be called asynchronously.
-            The method will return the request thread.
+            The method will return a future of the deserialized response,
+            blocking first while the executor queue is full.
             If parameter callback is None,
             then the method will return the response directly.
         """
@@ -317,53 +476,58 @@ class ApiClient(object):
             return self.__call_api(resource_path, method,
                                    path_params, query_params, header_params,
                                    body, post_params, files,
-                                   response_type, auth_settings, callback)
+                                   response_type, auth_settings, callback,
+                                   _preload_content)
         else:
-            thread = threading.Thread(target=self.__call_api,
-                                      args=(resource_path, method,
-                                            path_params, query_params,
-                                            header_params, body,
-                                            post_params, files,
-                                            response_type, auth_settings,
-                                            callback))
-        thread.start()
-        return thread
+            return self.executor.submit(self.__call_api,
+                                        resource_path, method,
+                                        path_params, query_params,
+                                        header_params, body,
+                                        post_params, files,
+                                        response_type, auth_settings,
+                                        callback, _preload_content)
 
     def request(self, method, url, query_params=None, headers=None,
-                post_params=None, body=None):
+                post_params=None, body=None, _preload_content=True):
         """
         Makes the HTTP request using RESTClient.
         """
         if method == "GET":
             return self.rest_client.GET(url,
                                         query_params=query_params,
-                                        headers=headers)
+                                        headers=headers,
+                                        _preload_content=_preload_content)
         elif method == "HEAD":
             return self.rest_client.HEAD(url,
                                          query_params=query_params,
-                                         headers=headers)
+                                         headers=headers,
+                                         _preload_content=_preload_content)
         elif method == "POST":
             return self.rest_client.POST(url,
                                          query_params=query_params,
                                          headers=headers,
                                          post_params=post_params,
-                                         body=body)
+                                         body=body,
+                                         _preload_content=_preload_content)
         elif method == "PUT":
             return self.rest_client.PUT(url,
                                         query_params=query_params,
                                         headers=headers,
                                         post_params=post_params,
-                                        body=body)
+                                        body=body,
+                                        _preload_content=_preload_content)
         elif method == "PATCH":
             return self.rest_client.PATCH(url,
                                           query_params=query_params,
                                           headers=headers,
                                           post_params=post_params,
-                                          body=body)
+                                          body=body,
+                                          _preload_content=_preload_content)
         elif method == "DELETE":
             return self.rest_client.DELETE(url,
                                            query_params=query_params,
-                                           headers=headers)
+                                           headers=headers,
+                                           _preload_content=_preload_content)
         else:
             raise ValueError(
                 "http method must be `GET`, `HEAD`,"
@@ -388,12 +552,11 @@ class ApiClient(object):
                 if not v:
                     continue
 
-                with open(v, 'rb') as f:
-                    filename = os.path.basename(f.name)
-                    filedata = f.read()
-                    mimetype = mimetypes.\
-                        guess_type(filename)[0] or 'application/octet-stream'
-                    params[k] = tuple([filename, filedata, mimetype])
+                # the file is read in chunks when the request is sent
+                filename = os.path.basename(v)
+                mimetype = mimetypes.\
+                    guess_type(filename)[0] or 'application/octet-stream'
+                params[k] = tuple([filename, UploadFile(v), mimetype])
 
         return params
 
@@ -461,7 +624,12 @@ class ApiClient(object):
         Saves response body into a file in a temporary folder,
         using the filename from the `Content-Disposition` header if provided.
 
-        :param response:  RESTResponse.
+        A response which was not preloaded is written in chunks as it is
+        received. With `Configuration().download_checksum` set to a hashlib
+        algorithm name, the digest of the body is computed on the way and
+        kept in `last_download_checksum`.
+
+        :param response:  RESTResponse or unread urllib3.HTTPResponse.
         :return: file path.
         """
         config = Configuration()
@@ -477,8 +645,35 @@ class ApiClient(object):
                 group(1)
             path = os.path.join(os.path.dirname(path), filename)
 
-        with open(path, "w") as f:
-            f.write(response.data)
+        if hasattr(response, 'stream'):
+            chunks = response.stream(DOWNLOAD_CHUNK_SIZE)
+        else:
+            chunks = [response.data]
+
+        digest = None
+        if config.download_checksum:
+            digest = hashlib.new(config.download_checksum)
+        size = 0
+        try:
+            with open(path, "wb") as f:
+                for chunk in chunks:
+                    if not isinstance(chunk, bytes):
+                        chunk = chunk.encode('utf8')
+                    if digest:
+                        digest.update(chunk)
+                    size += len(chunk)
+                    f.write(chunk)
+        finally:
+            if hasattr(response, 'release_conn'):
+                response.release_conn()
+
+        if digest:
+            self.last_download_checksum = digest.hexdigest()
+            logger.debug("Downloaded %s, %d bytes, %s %s" %
+                         (path, size, config.download_checksum,
+                          self.last_download_checksum))
+        else:
+            logger.debug("Downloaded %s, %d bytes" % (path, size))
 
         return path
 
@@ -56,14 +56,14 @@ class BpmApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_bpm_task_by_id(task_id, callback=callback_function)
+        >>> future = api.get_bpm_task_by_id(task_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int task_id: BPM task ID (required)
         :return: BpmTaskRestSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'task_id' is set
         if task_id is None:
@@ -134,7 +134,7 @@ class BpmApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_bpm_tasks(callback=callback_function)
+        >>> future = api.get_bpm_tasks(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -142,7 +142,7 @@ class BpmApi(object):
         :param int page_size: Pagination size
         :return: BpmTaskRestPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['page_index', 'page_size']
@@ -212,14 +212,14 @@ class BpmApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.notify_task(task_id, callback=callback_function)
+        >>> future = api.notify_task(task_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int task_id: BPM task ID (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'task_id' is set
         if task_id is None:
@@ -290,14 +290,14 @@ class BpmApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.start_r_creation_task_with_single_url(body, callback=callback_function)
+        >>> future = api.start_r_creation_task_with_single_url(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param RepositoryCreationUrlAutoRest body: Task parameters. (required)
         :return: int
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'body' is set
         if body is None:
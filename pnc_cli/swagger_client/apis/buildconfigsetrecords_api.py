@@ -56,14 +56,14 @@ class BuildconfigsetrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete(id, callback=callback_function)
+        >>> future = api.delete(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: BuildConfigSetRecord id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -134,7 +134,7 @@ class BuildconfigsetrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all(callback=callback_function)
+        >>> future = api.get_all(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -144,7 +144,7 @@ class BuildconfigsetrecordsApi(object):
         :param str q: RSQL Query
         :return: BuildConfigurationSetRecordPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['page_index', 'page_size', 'sort', 'q']
@@ -218,7 +218,7 @@ class BuildconfigsetrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_build_records(id, callback=callback_function)
+        >>> future = api.get_build_records(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -229,7 +229,7 @@ class BuildconfigsetrecordsApi(object):
         :param str q: RSQL Query
         :return: BuildRecordPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -308,14 +308,14 @@ class BuildconfigsetrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_specific(id, callback=callback_function)
+        >>> future = api.get_specific(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: BuildConfigSetRecord id (required)
         :return: BuildConfigSetRecordSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -56,7 +56,7 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_dependency(id, callback=callback_function)
+        >>> future = api.add_dependency(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -64,7 +64,7 @@ class BuildconfigurationsApi(object):
         :param BuildConfigurationRest body: 
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -137,7 +137,7 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_product_version(id, callback=callback_function)
+        >>> future = api.add_product_version(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -145,7 +145,7 @@ class BuildconfigurationsApi(object):
         :param ProductVersionRest body: 
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -218,14 +218,14 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.clone(id, callback=callback_function)
+        >>> future = api.clone(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: Build Configuration id (required)
         :return: BuildConfigurationSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -296,14 +296,14 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.create_new(callback=callback_function)
+        >>> future = api.create_new(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param BuildConfigurationRest body: 
         :return: BuildConfigurationSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['body']
@@ -371,14 +371,14 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_specific(id, callback=callback_function)
+        >>> future = api.delete_specific(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: Build Configuration id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -449,7 +449,7 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all(callback=callback_function)
+        >>> future = api.get_all(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -459,7 +459,7 @@ class BuildconfigurationsApi(object):
         :param str q: RSQL Query
         :return: BuildConfigurationPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['page_index', 'page_size', 'sort', 'q']
@@ -533,7 +533,7 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all_by_product_id(product_id, callback=callback_function)
+        >>> future = api.get_all_by_product_id(product_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -544,7 +544,7 @@ class BuildconfigurationsApi(object):
         :param str q: RSQL Query
         :return: BuildConfigurationPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'product_id' is set
         if product_id is None:
@@ -623,7 +623,7 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all_by_product_version_id(product_id, version_id, callback=callback_function)
+        >>> future = api.get_all_by_product_version_id(product_id, version_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -635,7 +635,7 @@ class BuildconfigurationsApi(object):
         :param str q: RSQL Query
         :return: BuildConfigurationPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'product_id' is set
         if product_id is None:
@@ -719,7 +719,7 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all_by_project_id(project_id, callback=callback_function)
+        >>> future = api.get_all_by_project_id(project_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -730,7 +730,7 @@ class BuildconfigurationsApi(object):
         :param str q: RSQL Query
         :return: BuildConfigurationPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'project_id' is set
         if project_id is None:
@@ -809,7 +809,7 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_build_configuration_sets(id, callback=callback_function)
+        >>> future = api.get_build_configuration_sets(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -820,7 +820,7 @@ class BuildconfigurationsApi(object):
         :param str q: RSQL Query
         :return: BuildConfigurationSetPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -899,7 +899,7 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_build_records(id, callback=callback_function)
+        >>> future = api.get_build_records(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -910,7 +910,7 @@ class BuildconfigurationsApi(object):
         :param str q: RSQL Query
         :return: BuildRecordPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -989,7 +989,7 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_builds(id, callback=callback_function)
+        >>> future = api.get_builds(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1000,7 +1000,7 @@ class BuildconfigurationsApi(object):
         :param str q: RSQL Query
         :return: BuildRecordPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -1079,7 +1079,7 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_dependencies(id, callback=callback_function)
+        >>> future = api.get_dependencies(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1090,7 +1090,7 @@ class BuildconfigurationsApi(object):
         :param str q: RSQL Query
         :return: BuildConfigurationPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -1169,14 +1169,14 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_latest_build_record(id, callback=callback_function)
+        >>> future = api.get_latest_build_record(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: Build configuration id (required)
         :return: BuildRecordPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -1247,7 +1247,7 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_product_versions(id, callback=callback_function)
+        >>> future = api.get_product_versions(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1258,7 +1258,7 @@ class BuildconfigurationsApi(object):
         :param str q: RSQL Query
         :return: ProductVersionPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -1337,7 +1337,7 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_revision(id, rev, callback=callback_function)
+        >>> future = api.get_revision(id, rev, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1345,7 +1345,7 @@ class BuildconfigurationsApi(object):
         :param int rev: Build configuration rev (required)
         :return: BuildConfigurationAuditedSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -1421,7 +1421,7 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_revisions(id, callback=callback_function)
+        >>> future = api.get_revisions(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1431,7 +1431,7 @@ class BuildconfigurationsApi(object):
         :param str sort: Sorting RSQL
         :return: BuildConfigurationAuditedPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -1508,14 +1508,14 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_specific(id, callback=callback_function)
+        >>> future = api.get_specific(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: Build Configuration id (required)
         :return: BuildConfigurationSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -1586,13 +1586,13 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_supported_generic_parameters(callback=callback_function)
+        >>> future = api.get_supported_generic_parameters(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = []
@@ -1658,7 +1658,7 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.remove_dependency(id, dependency_id, callback=callback_function)
+        >>> future = api.remove_dependency(id, dependency_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1666,7 +1666,7 @@ class BuildconfigurationsApi(object):
         :param int dependency_id: Build configuration id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -1742,7 +1742,7 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.remove_product_version(id, product_version_id, callback=callback_function)
+        >>> future = api.remove_product_version(id, product_version_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1750,7 +1750,7 @@ class BuildconfigurationsApi(object):
         :param int product_version_id: Product version id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -1826,7 +1826,7 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.trigger(id, callback=callback_function)
+        >>> future = api.trigger(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1839,7 +1839,7 @@ class BuildconfigurationsApi(object):
         :param bool timestamp_alignment: Should we add a timestamp during the alignment? Valid only for temporary builds.
         :return: BuildRecordSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -1922,7 +1922,7 @@ class BuildconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update(id, callback=callback_function)
+        >>> future = api.update(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1930,7 +1930,7 @@ class BuildconfigurationsApi(object):
         :param BuildConfigurationRest body: 
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -56,7 +56,7 @@ class BuildconfigurationsetsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_configuration(id, callback=callback_function)
+        >>> future = api.add_configuration(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -64,7 +64,7 @@ class BuildconfigurationsetsApi(object):
         :param BuildConfigurationRest body: 
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -137,7 +137,7 @@ class BuildconfigurationsetsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.build(id, callback=callback_function)
+        >>> future = api.build(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -148,7 +148,7 @@ class BuildconfigurationsetsApi(object):
         :param bool timestamp_alignment: Should we add a timestamp during the alignment? Valid only for temporary builds.
         :return: BuildConfigSetRecordSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -227,14 +227,14 @@ class BuildconfigurationsetsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.create_new(callback=callback_function)
+        >>> future = api.create_new(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param BuildConfigurationSetRest body: 
         :return: BuildConfigurationSetSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['body']
@@ -302,14 +302,14 @@ class BuildconfigurationsetsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_specific(id, callback=callback_function)
+        >>> future = api.delete_specific(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: Build Configuration Set id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -380,7 +380,7 @@ class BuildconfigurationsetsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all(callback=callback_function)
+        >>> future = api.get_all(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -390,7 +390,7 @@ class BuildconfigurationsetsApi(object):
         :param str q: RSQL Query
         :return: BuildConfigurationSetPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['page_index', 'page_size', 'sort', 'q']
@@ -464,7 +464,7 @@ class BuildconfigurationsetsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all_build_config_set_records(id, callback=callback_function)
+        >>> future = api.get_all_build_config_set_records(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -475,7 +475,7 @@ class BuildconfigurationsetsApi(object):
         :param str q: RSQL Query
         :return: BuildConfigurationSetRecordPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -554,7 +554,7 @@ class BuildconfigurationsetsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_build_records(id, callback=callback_function)
+        >>> future = api.get_build_records(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -565,7 +565,7 @@ class BuildconfigurationsetsApi(object):
         :param str q: RSQL Query
         :return: BuildRecordPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -644,7 +644,7 @@ class BuildconfigurationsetsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_configurations(id, callback=callback_function)
+        >>> future = api.get_configurations(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -655,7 +655,7 @@ class BuildconfigurationsetsApi(object):
         :param str q: RSQL Query
         :return: BuildConfigurationPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -734,14 +734,14 @@ class BuildconfigurationsetsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_specific(id, callback=callback_function)
+        >>> future = api.get_specific(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: Build Configuration Set id (required)
         :return: BuildConfigurationSetSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -812,7 +812,7 @@ class BuildconfigurationsetsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.remove_configuration(id, config_id, callback=callback_function)
+        >>> future = api.remove_configuration(id, config_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -820,7 +820,7 @@ class BuildconfigurationsetsApi(object):
         :param int config_id: Build configuration id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -896,7 +896,7 @@ class BuildconfigurationsetsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update(id, callback=callback_function)
+        >>> future = api.update(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -904,7 +904,7 @@ class BuildconfigurationsetsApi(object):
         :param BuildConfigurationSetRest body: 
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -977,7 +977,7 @@ class BuildconfigurationsetsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_configurations(id, callback=callback_function)
+        >>> future = api.update_configurations(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -985,7 +985,7 @@ class BuildconfigurationsetsApi(object):
         :param list[BuildConfigurationRest] body: 
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
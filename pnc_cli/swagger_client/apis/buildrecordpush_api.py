@@ -56,7 +56,7 @@ class BuildrecordpushApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.cancel(build_record_id, callback=callback_function)
+        >>> future = api.cancel(build_record_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -64,7 +64,7 @@ class BuildrecordpushApi(object):
         :param BuildRecordPushResultRest body: 
         :return: int
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'build_record_id' is set
         if build_record_id is None:
@@ -137,14 +137,14 @@ class BuildrecordpushApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get(build_record_id, callback=callback_function)
+        >>> future = api.get(build_record_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int build_record_id: Build Record id (required)
         :return: BuildRecordPushResultRest
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'build_record_id' is set
         if build_record_id is None:
@@ -215,14 +215,14 @@ class BuildrecordpushApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.push(callback=callback_function)
+        >>> future = api.push(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param BuildRecordPushRequestRest body: 
         :return: list[ResultRest]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['body']
@@ -290,7 +290,7 @@ class BuildrecordpushApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.push_1(build_record_id, callback=callback_function)
+        >>> future = api.push_1(build_record_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -298,7 +298,7 @@ class BuildrecordpushApi(object):
         :param BuildRecordPushResultRest body: 
         :return: int
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'build_record_id' is set
         if build_record_id is None:
@@ -371,14 +371,14 @@ class BuildrecordpushApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.push_record_set(callback=callback_function)
+        >>> future = api.push_record_set(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param BuildConfigSetRecordPushRequestRest body: 
         :return: list[ResultRest]
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['body']
@@ -446,14 +446,14 @@ class BuildrecordpushApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.status(build_record_id, callback=callback_function)
+        >>> future = api.status(build_record_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int build_record_id: Build Record id (required)
         :return: BuildRecordPushResultRest
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'build_record_id' is set
         if build_record_id is None:
@@ -56,14 +56,14 @@ class BuildrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete(id, callback=callback_function)
+        >>> future = api.delete(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: BuildRecord id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -134,7 +134,7 @@ class BuildrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all(callback=callback_function)
+        >>> future = api.get_all(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -144,7 +144,7 @@ class BuildrecordsApi(object):
         :param str q: RSQL Query
         :return: BuildRecordPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['page_index', 'page_size', 'sort', 'q']
@@ -218,7 +218,7 @@ class BuildrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all_for_build_configuration(configuration_id, callback=callback_function)
+        >>> future = api.get_all_for_build_configuration(configuration_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -229,7 +229,7 @@ class BuildrecordsApi(object):
         :param str q: RSQL Query
         :return: BuildRecordPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'configuration_id' is set
         if configuration_id is None:
@@ -308,7 +308,7 @@ class BuildrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all_for_project(name, callback=callback_function)
+        >>> future = api.get_all_for_project(name, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -319,7 +319,7 @@ class BuildrecordsApi(object):
         :param str q: RSQL query
         :return: BuildRecordPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'name' is set
         if name is None:
@@ -398,7 +398,7 @@ class BuildrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all_for_project_1(project_id, callback=callback_function)
+        >>> future = api.get_all_for_project_1(project_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -409,7 +409,7 @@ class BuildrecordsApi(object):
         :param str q: RSQL query
         :return: BuildRecordPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'project_id' is set
         if project_id is None:
@@ -488,14 +488,14 @@ class BuildrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_attributes(id, callback=callback_function)
+        >>> future = api.get_attributes(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: BuildRecord id (required)
         :return: AttributeSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -566,14 +566,14 @@ class BuildrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_build_configuration_audited(id, callback=callback_function)
+        >>> future = api.get_build_configuration_audited(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: BuildRecord id (required)
         :return: BuildConfigurationAuditedSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -644,7 +644,7 @@ class BuildrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_built_artifacts(id, callback=callback_function)
+        >>> future = api.get_built_artifacts(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -655,7 +655,7 @@ class BuildrecordsApi(object):
         :param str q: RSQL Query
         :return: ArtifactPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -734,14 +734,14 @@ class BuildrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_completed_or_runnning(id, callback=callback_function)
+        >>> future = api.get_completed_or_runnning(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: BuildRecord id (required)
         :return: BuildRecordSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -812,7 +812,7 @@ class BuildrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_dependency_artifacts(id, callback=callback_function)
+        >>> future = api.get_dependency_artifacts(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -823,7 +823,7 @@ class BuildrecordsApi(object):
         :param str q: RSQL Query
         :return: ArtifactPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -902,14 +902,14 @@ class BuildrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_logs(id, callback=callback_function)
+        >>> future = api.get_logs(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: BuildRecord id (required)
         :return: str
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -980,14 +980,14 @@ class BuildrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_repour_logs(id, callback=callback_function)
+        >>> future = api.get_repour_logs(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: BuildRecord id (required)
         :return: str
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -1058,14 +1058,14 @@ class BuildrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_specific(id, callback=callback_function)
+        >>> future = api.get_specific(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: BuildRecord id (required)
         :return: BuildRecordSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -1136,7 +1136,7 @@ class BuildrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.put_attribute(id, key, value, callback=callback_function)
+        >>> future = api.put_attribute(id, key, value, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1145,7 +1145,7 @@ class BuildrecordsApi(object):
         :param str value: Attribute value (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -1226,7 +1226,7 @@ class BuildrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.query_by_attribute(key, value, callback=callback_function)
+        >>> future = api.query_by_attribute(key, value, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1234,7 +1234,7 @@ class BuildrecordsApi(object):
         :param str value: Attribute value (required)
         :return: BuildRecordRest
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'key' is set
         if key is None:
@@ -1310,7 +1310,7 @@ class BuildrecordsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.remove_attribute(id, key, callback=callback_function)
+        >>> future = api.remove_attribute(id, key, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1318,7 +1318,7 @@ class BuildrecordsApi(object):
         :param str key: Attribute key (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
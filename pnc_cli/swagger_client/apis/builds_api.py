@@ -56,14 +56,14 @@ class BuildsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.cancel(id, callback=callback_function)
+        >>> future = api.cancel(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: BuildRecord id (required)
         :return: BuildRecordSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -134,7 +134,7 @@ class BuildsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all(callback=callback_function)
+        >>> future = api.get_all(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -146,7 +146,7 @@ class BuildsApi(object):
         :param str and_find_by_build_configuration_name: Find by BuildConfigurationName (query is combined with other criteria using AND.).
         :return: BuildRecordPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['page_index', 'page_size', 'sort', 'q', 'or_find_by_build_configuration_name', 'and_find_by_build_configuration_name']
@@ -224,14 +224,14 @@ class BuildsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_specific(id, callback=callback_function)
+        >>> future = api.get_specific(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: BuildRecord id (required)
         :return: BuildRecordSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -302,14 +302,14 @@ class BuildsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_ssh_credentials(id, callback=callback_function)
+        >>> future = api.get_ssh_credentials(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: BuildRecord id (required)
         :return: SshCredentialsSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
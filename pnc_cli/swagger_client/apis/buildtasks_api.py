@@ -56,7 +56,7 @@ class BuildtasksApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.build(build_execution_configuration, callback=callback_function)
+        >>> future = api.build(build_execution_configuration, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -65,7 +65,7 @@ class BuildtasksApi(object):
         :param str callback_url: Optional Callback URL
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'build_execution_configuration' is set
         if build_execution_configuration is None:
@@ -140,7 +140,7 @@ class BuildtasksApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.build_task_completed(task_id, build_result, callback=callback_function)
+        >>> future = api.build_task_completed(task_id, build_result, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -148,7 +148,7 @@ class BuildtasksApi(object):
         :param str build_result: Build result (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'task_id' is set
         if task_id is None:
@@ -224,14 +224,14 @@ class BuildtasksApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.cancel_bbuild(build_execution_configuration_id, callback=callback_function)
+        >>> future = api.cancel_bbuild(build_execution_configuration_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int build_execution_configuration_id: Build Execution Configuration ID. See org.jboss.pnc.spi.executor.BuildExecutionConfiguration. (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'build_execution_configuration_id' is set
         if build_execution_configuration_id is None:
@@ -56,14 +56,14 @@ class LicensesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.create_new(callback=callback_function)
+        >>> future = api.create_new(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param LicenseRest body: 
         :return: LicenseSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['body']
@@ -131,14 +131,14 @@ class LicensesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete(id, callback=callback_function)
+        >>> future = api.delete(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: License id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -209,7 +209,7 @@ class LicensesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all(callback=callback_function)
+        >>> future = api.get_all(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -219,7 +219,7 @@ class LicensesApi(object):
         :param str q: RSQL Query
         :return: LicensePage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['page_index', 'page_size', 'sort', 'q']
@@ -293,14 +293,14 @@ class LicensesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_specific(id, callback=callback_function)
+        >>> future = api.get_specific(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: License id (required)
         :return: LicenseSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -371,7 +371,7 @@ class LicensesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update(id, callback=callback_function)
+        >>> future = api.update(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -379,7 +379,7 @@ class LicensesApi(object):
         :param LicenseRest body: 
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -56,7 +56,7 @@ class ProductmilestonesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_distributed_artifact(id, callback=callback_function)
+        >>> future = api.add_distributed_artifact(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -64,7 +64,7 @@ class ProductmilestonesApi(object):
         :param ArtifactRest body: 
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -137,14 +137,14 @@ class ProductmilestonesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.cancel_milestone_close(id, callback=callback_function)
+        >>> future = api.cancel_milestone_close(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: Product Milestone id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -215,7 +215,7 @@ class ProductmilestonesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.close_milestone(id, callback=callback_function)
+        >>> future = api.close_milestone(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -223,7 +223,7 @@ class ProductmilestonesApi(object):
         :param ProductMilestoneRest body: 
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -296,14 +296,14 @@ class ProductmilestonesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.create_new(callback=callback_function)
+        >>> future = api.create_new(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param ProductMilestoneRest body: 
         :return: ProductMilestoneSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['body']
@@ -371,7 +371,7 @@ class ProductmilestonesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all(callback=callback_function)
+        >>> future = api.get_all(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -381,7 +381,7 @@ class ProductmilestonesApi(object):
         :param str q: RSQL Query
         :return: ProductMilestonePage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['page_index', 'page_size', 'sort', 'q']
@@ -455,7 +455,7 @@ class ProductmilestonesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all_by_product_version_id(version_id, callback=callback_function)
+        >>> future = api.get_all_by_product_version_id(version_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -466,7 +466,7 @@ class ProductmilestonesApi(object):
         :param str q: RSQL Query
         :return: ProductMilestonePage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'version_id' is set
         if version_id is None:
@@ -545,7 +545,7 @@ class ProductmilestonesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_distributed_artifacts(id, callback=callback_function)
+        >>> future = api.get_distributed_artifacts(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -556,7 +556,7 @@ class ProductmilestonesApi(object):
         :param str q: RSQL Query
         :return: ArtifactPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -635,7 +635,7 @@ class ProductmilestonesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_distributed_builds(id, callback=callback_function)
+        >>> future = api.get_distributed_builds(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -646,7 +646,7 @@ class ProductmilestonesApi(object):
         :param str q: RSQL Query
         :return: BuildRecordPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -725,14 +725,14 @@ class ProductmilestonesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_latest_release(id, callback=callback_function)
+        >>> future = api.get_latest_release(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id:  (required)
         :return: ProductMilestoneReleaseSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -803,7 +803,7 @@ class ProductmilestonesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_performed_builds(id, callback=callback_function)
+        >>> future = api.get_performed_builds(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -814,7 +814,7 @@ class ProductmilestonesApi(object):
         :param str q: RSQL Query
         :return: BuildRecordPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -893,14 +893,14 @@ class ProductmilestonesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_specific(id, callback=callback_function)
+        >>> future = api.get_specific(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: Product Milestone id (required)
         :return: ProductMilestoneSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -971,7 +971,7 @@ class ProductmilestonesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.remove_distributed_artifact(id, artifact_id, callback=callback_function)
+        >>> future = api.remove_distributed_artifact(id, artifact_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -979,7 +979,7 @@ class ProductmilestonesApi(object):
         :param int artifact_id: Artifact id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -1055,7 +1055,7 @@ class ProductmilestonesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update(id, callback=callback_function)
+        >>> future = api.update(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1063,7 +1063,7 @@ class ProductmilestonesApi(object):
         :param ProductMilestoneRest body: 
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
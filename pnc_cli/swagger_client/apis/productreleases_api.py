@@ -56,14 +56,14 @@ class ProductreleasesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.create_new(callback=callback_function)
+        >>> future = api.create_new(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param ProductReleaseRest body: 
         :return: ProductReleaseSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['body']
@@ -131,7 +131,7 @@ class ProductreleasesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all(callback=callback_function)
+        >>> future = api.get_all(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -141,7 +141,7 @@ class ProductreleasesApi(object):
         :param str q: RSQL Query
         :return: ProductReleasePage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['page_index', 'page_size', 'sort', 'q']
@@ -215,7 +215,7 @@ class ProductreleasesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all_builds_in_distributed_recordset_of_product_release(id, callback=callback_function)
+        >>> future = api.get_all_builds_in_distributed_recordset_of_product_release(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -226,7 +226,7 @@ class ProductreleasesApi(object):
         :param str q: RSQL Query
         :return: BuildRecordIds
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -305,7 +305,7 @@ class ProductreleasesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all_by_product_version_id(version_id, callback=callback_function)
+        >>> future = api.get_all_by_product_version_id(version_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -316,7 +316,7 @@ class ProductreleasesApi(object):
         :param str q: RSQL Query
         :return: ProductReleasePage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'version_id' is set
         if version_id is None:
@@ -395,13 +395,13 @@ class ProductreleasesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all_support_level(callback=callback_function)
+        >>> future = api.get_all_support_level(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: SupportLevelPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = []
@@ -467,14 +467,14 @@ class ProductreleasesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_specific(id, callback=callback_function)
+        >>> future = api.get_specific(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: Product Release id (required)
         :return: ProductReleaseSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -545,7 +545,7 @@ class ProductreleasesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update(id, callback=callback_function)
+        >>> future = api.update(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -553,7 +553,7 @@ class ProductreleasesApi(object):
         :param ProductReleaseRest body: 
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
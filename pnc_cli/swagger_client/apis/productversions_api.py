@@ -56,14 +56,14 @@ class ProductversionsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.create_new_product_version(callback=callback_function)
+        >>> future = api.create_new_product_version(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param ProductVersionRest body: 
         :return: ProductVersionSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['body']
@@ -131,7 +131,7 @@ class ProductversionsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all(callback=callback_function)
+        >>> future = api.get_all(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -141,7 +141,7 @@ class ProductversionsApi(object):
         :param str q: RSQL Query
         :return: ProductVersionPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['page_index', 'page_size', 'sort', 'q']
@@ -215,7 +215,7 @@ class ProductversionsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_build_configuration_sets(id, callback=callback_function)
+        >>> future = api.get_build_configuration_sets(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -226,7 +226,7 @@ class ProductversionsApi(object):
         :param str q: RSQL Query
         :return: BuildConfigurationSetPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -305,14 +305,14 @@ class ProductversionsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_specific(id, callback=callback_function)
+        >>> future = api.get_specific(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: Product Version id (required)
         :return: ProductVersionSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -383,7 +383,7 @@ class ProductversionsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update(id, callback=callback_function)
+        >>> future = api.update(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -391,7 +391,7 @@ class ProductversionsApi(object):
         :param ProductVersionRest body: 
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -464,7 +464,7 @@ class ProductversionsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_build_configuration_sets(id, callback=callback_function)
+        >>> future = api.update_build_configuration_sets(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -472,7 +472,7 @@ class ProductversionsApi(object):
         :param list[BuildConfigurationSetRest] body: 
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
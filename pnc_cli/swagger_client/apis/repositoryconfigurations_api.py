@@ -56,14 +56,14 @@ class RepositoryconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.create_new(callback=callback_function)
+        >>> future = api.create_new(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param RepositoryConfigurationRest body: 
         :return: RepositoryConfigurationSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['body']
@@ -131,7 +131,7 @@ class RepositoryconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_all(callback=callback_function)
+        >>> future = api.get_all(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -141,7 +141,7 @@ class RepositoryconfigurationsApi(object):
         :param str q: RSQL Query
         :return: RepositoryConfigurationPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['page_index', 'page_size', 'sort', 'q']
@@ -215,14 +215,14 @@ class RepositoryconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_specific(id, callback=callback_function)
+        >>> future = api.get_specific(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param int id: Repository Configuration id (required)
         :return: RepositoryConfigurationSingleton
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -293,7 +293,7 @@ class RepositoryconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.match(search, callback=callback_function)
+        >>> future = api.match(search, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -303,7 +303,7 @@ class RepositoryconfigurationsApi(object):
         :param str sort: Sorting RSQL
         :return: RepositoryConfigurationPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'search' is set
         if search is None:
@@ -380,7 +380,7 @@ class RepositoryconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.search(search, callback=callback_function)
+        >>> future = api.search(search, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -390,7 +390,7 @@ class RepositoryconfigurationsApi(object):
         :param str sort: Sorting RSQL
         :return: RepositoryConfigurationPage
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'search' is set
         if search is None:
@@ -467,7 +467,7 @@ class RepositoryconfigurationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update(id, callback=callback_function)
+        >>> future = api.update(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -475,7 +475,7 @@ class RepositoryconfigurationsApi(object):
         :param RepositoryConfigurationRest body: 
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
         # verify the required parameter 'id' is set
         if id is None:
@@ -56,13 +56,13 @@ class TestApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.nocontent(callback=callback_function)
+        >>> future = api.nocontent(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = []
@@ -128,13 +128,13 @@ class TestApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.redirect(callback=callback_function)
+        >>> future = api.redirect(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = []
@@ -200,14 +200,14 @@ class TestApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.send_build_set_status_changed_event(callback=callback_function)
+        >>> future = api.send_build_set_status_changed_event(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param BuildSetStatusChangedEvent body: 
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['body']
@@ -275,14 +275,14 @@ class TestApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.send_build_status_changed_event(callback=callback_function)
+        >>> future = api.send_build_status_changed_event(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param BuildStatusChangedEventRest body: 
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = ['body']
@@ -350,13 +350,13 @@ class TestApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.throw_ex(callback=callback_function)
+        >>> future = api.throw_ex(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a future of the response.
         """
 
         all_params = []
@@ -60,6 +60,9 @@ class Configuration(object):
         self.api_client = None
         # Temp file folder for downloading files
         self.temp_folder_path = None
+        # hashlib algorithm computing the checksum of downloaded files,
+        # e.g. 'sha256'. None skips it.
+        self.download_checksum = None
 
         # Authentication Settings
         # dict to store API key(s)
@@ -84,6 +87,29 @@ class Configuration(object):
         self.verify_ssl = True
         # Set this to customize the certificate file to verify the peer.
         self.ssl_ca_cert = None
+
+        # Connection pool settings
+        # Number of hosts kept in the pool manager.
+        self.connection_pool_size = 4
+        # Maximum number of connections kept per host.
+        self.connection_pool_maxsize = 10
+        # Set this to true to wait for a free connection instead of opening
+        # a throw-away one when all connections to a host are busy.
+        self.connection_pool_block = False
+        # Seconds a kept-alive connection may stay idle before it is discarded.
+        # None keeps idle connections until the server drops them.
+        self.connection_pool_idle_timeout = None
+
+        # Asynchronous (callback) request settings
+        # Number of requests run concurrently.
+        self.async_workers = 8
+        # Number of requests allowed to wait for a worker before
+        # further submissions block.
+        self.async_queue_size = 64
+
+        # Set this to true to keep GET responses for the lifetime of the
+        # ApiClient, until a modifying request is made.
+        self.memoize_get_requests = False
         
     def init_logger(self):
         """
@@ -20,15 +20,18 @@ https://www.dropbox.com/developers/core/sdks/python
 """
 from __future__ import absolute_import
 
+import os
 import sys
 import io
 import json
 import ssl
+import time
+import threading
 import certifi
 import logging
 
 # python 2 and python 3 compatibility library
-from six import iteritems
+from six import iteritems, text_type
 
 from .configuration import Configuration
 
@@ -69,29 +72,230 @@ class RESTResponse(io.IOBase):
         return self.urllib3_response.getheader(name, default)
 
 
+class PoolStats(object):
+    """
+    Thread-safe counters of the connections opened, reused
+    and discarded by a connection pool.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def increment(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def to_dict(self):
+        """
+        Returns the counters as a dict.
+        """
+        return {'opened': self.opened,
+                'reused': self.reused,
+                'discarded': self.discarded}
+
+    def __str__(self):
+        return "opened={opened} reused={reused} discarded={discarded}".\
+            format(**self.to_dict())
+
+
+class MeteredPoolMixin(object):
+    """
+    Connection pool mix-in which records connection usage in `pool_stats`
+    and closes keep-alive connections idle for more than `idle_timeout`
+    seconds before handing them out again.
+    """
+    pool_stats = None
+    idle_timeout = None
+
+    def _new_conn(self):
+        self.pool_stats.increment('opened')
+        return super(MeteredPoolMixin, self)._new_conn()
+
+    def _get_conn(self, timeout=None):
+        conn = super(MeteredPoolMixin, self)._get_conn(timeout=timeout)
+        released_at = getattr(conn, 'released_at', None)
+        if released_at is None:
+            # freshly created, already counted by `_new_conn`
+            return conn
+
+        if conn.sock is not None and self.idle_timeout is not None \
+           and time.time() - released_at > self.idle_timeout:
+            conn.close()
+
+        if conn.sock is None:
+            # dropped by the server or idle for too long, it will reconnect
+            self.pool_stats.increment('discarded')
+            self.pool_stats.increment('opened')
+        else:
+            self.pool_stats.increment('reused')
+        return conn
+
+    def _put_conn(self, conn):
+        connected = conn is not None and conn.sock is not None
+        if conn is not None:
+            conn.released_at = time.time()
+        super(MeteredPoolMixin, self)._put_conn(conn)
+        # urllib3 closes the connection when the pool is already full
+        if connected and conn.sock is None:
+            self.pool_stats.increment('discarded')
+
+
+class UploadFile(object):
+    """
+    A file form parameter which is read from disk while the request
+    body is being sent, instead of being loaded in memory up front.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.size = os.path.getsize(path)
+
+
+class MultipartBody(object):
+    """
+    File-like `multipart/form-data` request body.
+
+    Produces the same encoding as `urllib3.encode_multipart_formdata`,
+    but the contents of `UploadFile` parts are read in chunks as the
+    connection consumes the body.
+    """
+
+    def __init__(self, fields, boundary=None):
+        self.boundary = boundary or urllib3.filepost.choose_boundary()
+        self.content_type = 'multipart/form-data; boundary=%s' % self.boundary
+        self.parts = []
+        for name, value in iteritems(fields):
+            if isinstance(value, tuple) and isinstance(value[1], UploadFile):
+                upload = value[1]
+                value = (value[0], b'', value[2])
+            else:
+                upload = None
+            field = urllib3.fields.RequestField.from_tuples(name, value)
+            self.parts.append(self._encode('--%s\r\n' % self.boundary))
+            self.parts.append(self._encode(field.render_headers()))
+            if upload is not None:
+                self.parts.append(upload)
+            else:
+                data = field.data
+                if isinstance(data, int):
+                    data = str(data)
+                self.parts.append(self._encode(data))
+            self.parts.append(b'\r\n')
+        self.parts.append(self._encode('--%s--\r\n' % self.boundary))
+        self.length = sum(part.size if isinstance(part, UploadFile)
+                          else len(part) for part in self.parts)
+        self.sent = 0
+        self.started = None
+        self._pending = list(self.parts)
+        self._file = None
+
+    def _encode(self, value):
+        if isinstance(value, text_type):
+            return value.encode('utf-8')
+        return value
+
+    def read(self, size=-1):
+        """
+        Reads up to `size` bytes of the body, an empty string at the end.
+        """
+        if size is None or size < 0:
+            size = self.length
+        if self.started is None:
+            self.started = time.time()
+        chunk = b''
+        while not chunk and self._pending:
+            part = self._pending[0]
+            if isinstance(part, UploadFile):
+                if self._file is None:
+                    self._file = open(part.path, 'rb')
+                chunk = self._file.read(size)
+                if len(chunk) < size:
+                    self._file.close()
+                    self._file = None
+                    self._pending.pop(0)
+            else:
+                chunk = part[:size]
+                if len(chunk) < len(part):
+                    self._pending[0] = part[size:]
+                else:
+                    self._pending.pop(0)
+        self.sent += len(chunk)
+        if not self._pending and chunk:
+            self.log_throughput()
+        return chunk
+
+    def log_throughput(self):
+        elapsed = max(time.time() - self.started, 0.001)
+        logger.debug("uploaded %d bytes in %.2f s (%.1f KB/s)"
+                     % (self.sent, elapsed, self.sent / elapsed / 1024))
+
+
 class RESTClientObject(object):
 
-    def __init__(self, pools_size=4):
-        if Configuration().verify_ssl:
+    def __init__(self, pools_size=None, maxsize=None, block=None,
+                 idle_timeout=None):
+        """
+        :param pools_size: number of hosts kept in the pool manager.
+        :param maxsize: maximum number of connections kept per host.
+        :param block: wait for a free connection instead of opening
+                      a throw-away one when a host's pool is exhausted.
+        :param idle_timeout: seconds a kept-alive connection may stay idle
+                             before it is discarded, None to keep it forever.
+
+        Parameters left to None are taken from `Configuration`.
+        """
+        config = Configuration()
+        if pools_size is None:
+            pools_size = config.connection_pool_size
+        if maxsize is None:
+            maxsize = config.connection_pool_maxsize
+        if block is None:
+            block = config.connection_pool_block
+        if idle_timeout is None:
+            idle_timeout = config.connection_pool_idle_timeout
+
+        if config.verify_ssl:
             cert_reqs = ssl.CERT_REQUIRED
         else:
             cert_reqs = ssl.CERT_NONE
 
-        if Configuration().ssl_ca_cert:
-            ca_certs = Configuration().ssl_ca_cert
+        if config.ssl_ca_cert:
+            ca_certs = config.ssl_ca_cert
         else:
             # if not set certificate file, use Mozilla's root certificates.
             ca_certs = certifi.where()
 
+        self.pool_stats = PoolStats()
+        # Optional store of GET responses revalidated with conditional
+        # requests, see `cache_key` for the keys it is given.
+        self.cache = None
+
         # https pool manager
         self.pool_manager = urllib3.PoolManager(
             num_pools=pools_size,
+            maxsize=maxsize,
+            block=block,
             cert_reqs=cert_reqs,
             ca_certs=ca_certs
         )
+        pool_attrs = {'pool_stats': self.pool_stats,
+                      'idle_timeout': idle_timeout}
+        self.pool_manager.pool_classes_by_scheme = {
+            'http': type('MeteredHTTPConnectionPool',
+                         (MeteredPoolMixin,
+                          urllib3.connectionpool.HTTPConnectionPool),
+                         pool_attrs),
+            'https': type('MeteredHTTPSConnectionPool',
+                          (MeteredPoolMixin,
+                           urllib3.connectionpool.HTTPSConnectionPool),
+                          pool_attrs),
+        }
 
     def request(self, method, url, query_params=None, headers=None,
-                body=None, post_params=None):
+                body=None, post_params=None, _preload_content=True):
         """
         :param method: http request method
         :param url: http request url
@@ -101,6 +305,9 @@ class RESTClientObject(object):
         :param post_params: request post parameters,
                             `application/x-www-form-urlencode`
                             and `multipart/form-data`
+        :param _preload_content: if False, the urllib3.HTTPResponse is
+                                 returned without reading its body, so that
+                                 it can be streamed with `stream()`.
         """
         method = method.upper()
         assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT', 'PATCH']
@@ -119,6 +326,18 @@ class RESTClientObject(object):
         if body:
             logger.debug("request body: %s" % body)
 
+        cache_key = cached = None
+        if method == 'GET' and self.cache is not None and _preload_content:
+            cache_key = self.cache_key(url, query_params, headers)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                cached_headers = urllib3.response.HTTPHeaderDict(cached[0])
+                headers = dict(headers)
+                if 'ETag' in cached_headers:
+                    headers['If-None-Match'] = cached_headers['ETag']
+                if 'Last-Modified' in cached_headers:
+                    headers['If-Modified-Since'] = cached_headers['Last-Modified']
+
         try:
             # For `POST`, `PUT`, `PATCH`
             if method in ['POST', 'PUT', 'PATCH']:
@@ -127,29 +346,52 @@ class RESTClientObject(object):
                 if headers['Content-Type'] == 'application/json':
                     r = self.pool_manager.request(method, url,
                                                   body=json.dumps(body),
+                                                  preload_content=_preload_content,
                                                   headers=headers)
                 if headers['Content-Type'] == 'application/x-www-form-urlencoded':
                     r = self.pool_manager.request(method, url,
                                                   fields=post_params,
                                                   encode_multipart=False,
+                                                  preload_content=_preload_content,
                                                   headers=headers)
                 if headers['Content-Type'] == 'multipart/form-data':
-                    # must del headers['Content-Type'], or the correct Content-Type
-                    # which generated by urllib3 will be overwritten.
-                    del headers['Content-Type']
+                    # files are streamed from disk while the body is sent,
+                    # so the boundary and length must be set here.
+                    multipart = MultipartBody(post_params)
+                    headers['Content-Type'] = multipart.content_type
+                    headers['Content-Length'] = str(multipart.length)
                     r = self.pool_manager.request(method, url,
-                                                  fields=post_params,
-                                                  encode_multipart=True,
+                                                  body=multipart,
+                                                  preload_content=_preload_content,
                                                   headers=headers)
             # For `GET`, `HEAD`, `DELETE`
             else:
                 r = self.pool_manager.request(method, url,
                                               fields=query_params,
+                                              preload_content=_preload_content,
                                               headers=headers)
         except urllib3.exceptions.SSLError as e:
             msg = "{0}\n{1}".format(type(e).__name__, str(e))
             raise ApiException(status=0, reason=msg)
 
+        if not _preload_content:
+            if r.status not in range(200, 206):
+                # errors are small, read them for the exception message
+                r = RESTResponse(r)
+                if sys.version_info > (3,):
+                    r.data = r.data.decode('utf8')
+                raise ApiException(http_resp=r)
+            return r
+
+        if cached is not None and r.status == 304:
+            logger.debug("%s not modified, using cached response" % url)
+            r = urllib3.HTTPResponse(body=io.BytesIO(cached[1]),
+                                     headers=cached[0],
+                                     status=200, reason='OK')
+        elif cache_key is not None and r.status == 200 \
+                and (r.getheader('ETag') or r.getheader('Last-Modified')):
+            self.cache.put(cache_key, dict(r.getheaders()), r.data)
+
         r = RESTResponse(r)
 
         # In the python 3, the response.data is bytes.
@@ -165,41 +407,61 @@ class RESTClientObject(object):
 
         return r
 
-    def GET(self, url, headers=None, query_params=None):
+    def cache_key(self, url, query_params, headers):
+        """
+        Returns the key identifying a GET response in `cache`.
+        """
+        if query_params:
+            url += '?' + urlencode(sorted(iteritems(query_params)))
+        return "{0} {1}".format(headers.get('Accept'), url)
+
+    def GET(self, url, headers=None, query_params=None,
+            _preload_content=True):
         return self.request("GET", url,
                             headers=headers,
-                            query_params=query_params)
+                            query_params=query_params,
+                            _preload_content=_preload_content)
 
-    def HEAD(self, url, headers=None, query_params=None):
+    def HEAD(self, url, headers=None, query_params=None,
+             _preload_content=True):
         return self.request("HEAD", url,
                             headers=headers,
-                            query_params=query_params)
+                            query_params=query_params,
+                            _preload_content=_preload_content)
 
-    def DELETE(self, url, headers=None, query_params=None):
+    def DELETE(self, url, headers=None, query_params=None,
+               _preload_content=True):
         return self.request("DELETE", url,
                             headers=headers,
-                            query_params=query_params)
+                            query_params=query_params,
+                            _preload_content=_preload_content)
 
-    def POST(self, url, headers=None, query_params=None, post_params=None, body=None):
+    def POST(self, url, headers=None, query_params=None, post_params=None, body=None,
+             _preload_content=True):
         return self.request("POST", url,
                             headers=headers,
                             query_params=query_params,
                             post_params=post_params,
-                            body=body)
+                            body=body,
+                            _preload_content=_preload_content)
 
-    def PUT(self, url, headers=None, query_params=None, post_params=None, body=None):
+    def PUT(self, url, headers=None, query_params=None, post_params=None, body=None,
+            _preload_content=True):
         return self.request("PUT", url,
                             headers=headers,
                             query_params=query_params,
                             post_params=post_params,
-                            body=body)
+                            body=body,
+                            _preload_content=_preload_content)
 
-    def PATCH(self, url, headers=None, query_params=None, post_params=None, body=None):
+    def PATCH(self, url, headers=None, query_params=None, post_params=None, body=None,
+              _preload_content=True):
         return self.request("PATCH", url,
                             headers=headers,
                             query_params=query_params,
                             post_params=post_params,
-                            body=body)
+                            body=body,
+                            _preload_content=_preload_content)
 
 
 class ApiException(Exception):
@@ -12,7 +12,9 @@ import sys
 import requests
 
 import swagger_client
+from swagger_client.rest import RESTClientObject
 import pnc_cli.utils as utils
+from pnc_cli.http_cache import HttpCache
 import keycloak_config as kc
 import pnc_server_config as psc
 
@@ -26,6 +28,8 @@ except NameError:
 
 SAVED_USER_FILENAME = "saved-user.p"
 SAVED_USER = utils.CONFIG_LOCATION + SAVED_USER_FILENAME
+HTTP_CACHE = utils.CONFIG_LOCATION + "http-cache/"
+HTTP_CACHE_SIZE_MB = 64
 
 trueValues = ['True', 'true', '1']
 
@@ -159,15 +163,43 @@ class UserConfig():
     def create_api_client(self):
         if self.token:
             return swagger_client.ApiClient(self.pnc_config.url, header_name='Authorization',
-                                            header_value='Bearer ' + self.token)
+                                            header_value='Bearer ' + self.token,
+                                            rest_client=get_rest_client(self.pnc_config))
         else:
             logging.error("No Keycloak token is present. Commands requiring authentication will fail.")
-            return swagger_client.ApiClient(self.pnc_config.url)
+            return swagger_client.ApiClient(self.pnc_config.url, rest_client=get_rest_client(self.pnc_config))
 
     def get_api_client(self):
         return self.apiclient
 
 user = None
+rest_client = None
+
+
+def get_rest_client(pnc_config):
+    """
+    Returns the RESTClientObject shared by every ApiClient, so that all APIs reuse one connection pool and cache
+    """
+    global rest_client
+    if rest_client is None:
+        rest_client = RESTClientObject(maxsize=pnc_config.pool_maxsize,
+                                       block=pnc_config.pool_block,
+                                       idle_timeout=pnc_config.pool_idle_timeout)
+        cache_size = pnc_config.http_cache_size
+        if cache_size is None:
+            cache_size = HTTP_CACHE_SIZE_MB
+        if cache_size > 0:
+            rest_client.cache = HttpCache(HTTP_CACHE, cache_size * 1024 * 1024)
+        # settings the ApiClients pick up when they are created
+        configuration = swagger_client.Configuration()
+        if pnc_config.async_workers:
+            configuration.async_workers = pnc_config.async_workers
+        if pnc_config.async_queue_size is not None:
+            configuration.async_queue_size = pnc_config.async_queue_size
+        if pnc_config.memoize_requests is not None:
+            configuration.memoize_get_requests = pnc_config.memoize_requests
+    return rest_client
+
 
 def get_user():
     global user
@@ -0,0 +1,46 @@
+import threading
+
+import pytest
+from six.moves import BaseHTTPServer
+
+
+class StubHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """
+    Answers every request with the next response queued on the server,
+    or an empty JSON page once the queue is exhausted
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def do_request(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else None
+        self.server.requests.append((self.command, self.path, dict(self.headers), body))
+        if self.server.responses:
+            status, headers, body = self.server.responses.pop(0)
+        else:
+            status, headers, body = 200, {'Content-Type': 'application/json'}, b'{"content": []}'
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_HEAD = do_POST = do_PUT = do_DELETE = do_request
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), StubHandler)
+    server.responses = []
+    server.requests = []
+    server.url = 'http://127.0.0.1:{}'.format(server.server_address[1])
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
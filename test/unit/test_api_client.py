@@ -0,0 +1,99 @@
+import hashlib
+import threading
+import time
+
+from pnc_cli.swagger_client.api_client import ApiClient, BoundedExecutor, RequestCoalescer
+from pnc_cli.swagger_client.configuration import Configuration
+
+
+def test_bounded_executor_blocks_when_queue_full():
+    executor = BoundedExecutor(max_workers=1, queue_size=1)
+    release = threading.Event()
+    executor.submit(release.wait)
+    second = executor.submit(lambda: 2)
+    submitted = threading.Event()
+
+    def submit_third():
+        executor.submit(lambda: 3)
+        submitted.set()
+    threading.Thread(target=submit_third).start()
+
+    assert not submitted.wait(0.2)
+    release.set()
+    assert submitted.wait(5)
+    assert second.result(timeout=5) == 2
+    executor.shutdown()
+
+
+def test_call_api_with_callback_returns_future(stub_server):
+    client = ApiClient(host=stub_server.url)
+    results = []
+    future = client.call_api('/', 'GET', response_type='object', callback=results.append)
+    data = future.result(timeout=5)
+    assert results == [data]
+
+
+def test_coalescer_shares_in_flight_request():
+    coalescer = RequestCoalescer()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return 'response'
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(coalescer.request('key', fetch)))
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=lambda: results.append(coalescer.request('key', fetch)))
+    follower.start()
+    time.sleep(0.1)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+    assert results == ['response', 'response']
+    assert len(calls) == 1
+
+
+def test_coalescer_memoizes_until_invalidated():
+    coalescer = RequestCoalescer(memoize=True)
+    responses = iter(['first', 'second'])
+    assert coalescer.request('key', lambda: next(responses)) == 'first'
+    assert coalescer.request('key', lambda: next(responses)) == 'first'
+    coalescer.invalidate()
+    assert coalescer.request('key', lambda: next(responses)) == 'second'
+
+
+def test_get_requests_memoized_until_put(stub_server):
+    client = ApiClient(host=stub_server.url)
+    client.coalescer.memoize = True
+    client.call_api('/products/1', 'GET', header_params={'Accept': 'application/json'})
+    client.call_api('/products/1', 'GET', header_params={'Accept': 'application/json'})
+    client.call_api('/products/1', 'PUT', body={'name': 'product'})
+    client.call_api('/products/1', 'GET', header_params={'Accept': 'application/json'})
+    assert [request[0] for request in stub_server.requests] == ['GET', 'PUT', 'GET']
+
+
+def test_call_api_without_preloading_content(stub_server):
+    stub_server.responses = [(200, {'Content-Type': 'text/plain'}, b'line 1\nline 2\n')]
+    client = ApiClient(host=stub_server.url)
+    response = client.call_api('/build-records/1/log', 'GET', _preload_content=False)
+    assert b''.join(response.stream(4)) == b'line 1\nline 2\n'
+    response.release_conn()
+
+
+def test_file_response_streamed_to_disk(stub_server, tmpdir, monkeypatch):
+    body = b'\x00\x01' * 100000
+    stub_server.responses = [(200, {'Content-Disposition': 'attachment; filename="artifact.jar"'}, body)]
+    config = Configuration()
+    monkeypatch.setattr(config, 'temp_folder_path', str(tmpdir))
+    monkeypatch.setattr(config, 'download_checksum', 'sha256')
+    client = ApiClient(host=stub_server.url)
+    path = client.call_api('/artifacts/1', 'GET', response_type='file')
+    assert path == str(tmpdir.join('artifact.jar'))
+    assert tmpdir.join('artifact.jar').read_binary() == body
+    assert client.last_download_checksum == hashlib.sha256(body).hexdigest()
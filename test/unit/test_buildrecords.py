@@ -94,6 +94,35 @@ def test_get_log_for_record(mock):
     assert result == 'log here.'
 
 
+@patch('pnc_cli.buildrecords.pnc_api.builds')
+def test_stream_log_to_file(mock_records_api, tmpdir):
+    mock_records_api.api_client.call_api.return_value = MagicMock(status=200, stream=lambda size: iter([b'line 1\nli', b'ne 2\n']))
+    output = str(tmpdir.join('build.log'))
+    buildrecords.stream_log('/build-records/{id}/log', 100, output=output)
+    mock_records_api.api_client.call_api.assert_called_once_with('/build-records/{id}/log', 'GET', path_params={'id': 100},
+                                                                 header_params={'Accept': 'text/plain'},
+                                                                 _preload_content=False)
+    assert tmpdir.join('build.log').read() == 'line 1\nline 2\n'
+
+
+@patch('pnc_cli.buildrecords.pnc_api.builds')
+def test_stream_log_resume(mock_records_api, tmpdir):
+    mock_records_api.api_client.call_api.return_value = MagicMock(status=206, stream=lambda size: iter([b'ne 2\n']))
+    tmpdir.join('build.log').write('line 1\nli')
+    output = str(tmpdir.join('build.log'))
+    buildrecords.stream_log('/build-records/{id}/log', 100, output=output, resume=True)
+    assert mock_records_api.api_client.call_api.call_args[1]['header_params']['Range'] == 'bytes=9-'
+    assert tmpdir.join('build.log').read() == 'line 1\nline 2\n'
+
+
+@patch('pnc_cli.buildrecords.pnc_api.builds')
+def test_stream_log_tail(mock_records_api, tmpdir):
+    mock_records_api.api_client.call_api.return_value = MagicMock(status=200, stream=lambda size: iter([b'1\n2\n3', b'\n4\n5']))
+    output = str(tmpdir.join('build.log'))
+    buildrecords.stream_log('/build-records/{id}/repour-log', 100, output=output, tail=2)
+    assert tmpdir.join('build.log').read() == '4\n5\n'
+
+
 @patch('pnc_cli.buildrecords.pnc_api.builds.put_attribute')
 def test_put_attribute(mock):
     result = buildrecords.put_attribute(1,'key','value')
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+from mock import patch
+
+import pnc_cli.entity_cache as entity_cache
+from pnc_cli.swagger_client import ApiClient
+from pnc_cli.swagger_client import BuildEnvironmentRest
+from pnc_cli.swagger_client import BuildEnvironmentSingleton
+from pnc_cli.swagger_client import EnvironmentsApi
+
+
+@pytest.fixture
+def cache(tmpdir, monkeypatch):
+    monkeypatch.setattr(entity_cache, 'ENTITY_CACHE', str(tmpdir.join('entity-cache.json')))
+    monkeypatch.setattr(entity_cache, 'entries', None)
+    monkeypatch.setattr(entity_cache, 'dirty', False)
+    monkeypatch.setattr(entity_cache, 'enabled', True)
+    return entity_cache
+
+
+def environment_singleton():
+    environment = BuildEnvironmentRest()
+    environment.id = 1
+    environment.name = 'env'
+    singleton = BuildEnvironmentSingleton()
+    singleton.content = environment
+    return singleton
+
+
+@patch('pnc_cli.utils.checked_api_call')
+def test_get_specific_cached(mock, cache):
+    mock.return_value = environment_singleton()
+    api = EnvironmentsApi(ApiClient())
+    cache.get_specific(api, 1)
+    result = cache.get_specific(api, 1)
+    mock.assert_called_once_with(api, 'get_specific', id=1)
+    assert result.content.to_dict() == environment_singleton().content.to_dict()
+
+
+@patch('pnc_cli.utils.checked_api_call')
+def test_get_specific_expired(mock, cache):
+    mock.return_value = environment_singleton()
+    api = EnvironmentsApi(ApiClient())
+    with patch('pnc_cli.utils.current_time_millis', return_value=0):
+        cache.get_specific(api, 1)
+    cache.get_specific(api, 1)
+    assert mock.call_count == 2
+
+
+@patch('pnc_cli.utils.checked_api_call')
+def test_invalidate(mock, cache):
+    mock.return_value = environment_singleton()
+    api = EnvironmentsApi(ApiClient())
+    cache.get_specific(api, 1)
+    cache.invalidate(api, 1)
+    cache.get_specific(api, 1)
+    assert mock.call_count == 2
+
+
+@patch('pnc_cli.utils.checked_api_call')
+def test_disabled(mock, cache):
+    mock.return_value = environment_singleton()
+    api = EnvironmentsApi(ApiClient())
+    cache.disable()
+    cache.get_specific(api, 1)
+    cache.get_specific(api, 1)
+    assert mock.call_count == 2
+
+
+@patch('pnc_cli.utils.checked_api_call')
+def test_save(mock, cache):
+    mock.return_value = environment_singleton()
+    cache.get_specific(EnvironmentsApi(ApiClient()), 1)
+    cache.save()
+    with open(cache.ENTITY_CACHE) as f:
+        saved = json.load(f)
+    assert list(saved) == ['EnvironmentsApi:1']
+    assert saved['EnvironmentsApi:1']['type'] == 'BuildEnvironmentSingleton'
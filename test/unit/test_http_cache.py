@@ -0,0 +1,23 @@
+import os
+
+from pnc_cli.http_cache import HttpCache
+
+
+def test_put_get(tmpdir):
+    cache = HttpCache(str(tmpdir), 1024)
+    cache.put('GET /products', {'ETag': '"1"'}, b'{"content": []}')
+    assert cache.get('GET /products') == ({'ETag': '"1"'}, b'{"content": []}')
+    assert cache.get('GET /projects') is None
+
+
+def test_evicts_least_recently_used(tmpdir):
+    cache = HttpCache(str(tmpdir), 300)
+    cache.put('first', {}, b'x' * 100)
+    cache.put('second', {}, b'x' * 100)
+    first = cache._path('first')
+    os.utime(cache._path('second'), (1, 1))
+    os.utime(first, (2, 2))
+    cache.put('third', {}, b'x' * 100)
+    assert cache.get('second') is None
+    assert cache.get('first') is not None
+    assert cache.get('third') is not None
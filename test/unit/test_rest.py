@@ -0,0 +1,57 @@
+import urllib3
+
+from pnc_cli.http_cache import HttpCache
+from pnc_cli.swagger_client.rest import MultipartBody, RESTClientObject, UploadFile
+
+
+def test_pool_reuses_connections(stub_server):
+    client = RESTClientObject()
+    for _ in range(3):
+        client.GET(stub_server.url)
+    assert client.pool_stats.to_dict() == {'opened': 1, 'reused': 2, 'discarded': 0}
+
+
+def test_pool_discards_idle_connections(stub_server):
+    client = RESTClientObject(idle_timeout=-1)
+    client.GET(stub_server.url)
+    client.GET(stub_server.url)
+    assert client.pool_stats.to_dict() == {'opened': 2, 'reused': 0, 'discarded': 1}
+
+
+def test_pool_settings_passed_to_pool_manager():
+    client = RESTClientObject(maxsize=7, block=True)
+    pool = client.pool_manager.connection_from_url('http://localhost:1/')
+    assert pool.pool.maxsize == 7
+    assert pool.block
+
+
+def test_not_modified_served_from_cache(stub_server, tmpdir):
+    client = RESTClientObject()
+    client.cache = HttpCache(str(tmpdir), 1024 * 1024)
+    stub_server.responses = [(200, {'ETag': '"v1"'}, b'{"id": 1}'),
+                             (304, {'ETag': '"v1"'}, b'')]
+    assert client.GET(stub_server.url + '/products/1').data == '{"id": 1}'
+    response = client.GET(stub_server.url + '/products/1')
+    assert response.status == 200
+    assert response.data == '{"id": 1}'
+    assert stub_server.requests[1][2]['if-none-match'] == '"v1"'
+
+
+def test_multipart_body_streams_files(stub_server, tmpdir):
+    upload = tmpdir.join('artifact.jar')
+    upload.write_binary(b'x' * (200 * 1024))
+    fields = {'name': 'artifact',
+              'file': ('artifact.jar', UploadFile(str(upload)), 'application/java-archive')}
+    body = MultipartBody(fields, boundary='boundary')
+    expected, content_type = urllib3.encode_multipart_formdata(
+        {'name': 'artifact',
+         'file': ('artifact.jar', upload.read_binary(), 'application/java-archive')},
+        boundary='boundary')
+    assert body.length == len(expected)
+    assert body.content_type == content_type
+
+    client = RESTClientObject()
+    client.POST(stub_server.url + '/upload', post_params=fields,
+                headers={'Content-Type': 'multipart/form-data'})
+    method, path, headers, sent = stub_server.requests[0]
+    assert sent == expected